@@ -238,6 +238,20 @@ class WcRegexp(util.Immutable):
             root_dir=root_dir
         ).match()
 
+    def match_many(self, filenames, root_dir=None):
+        """
+        Match multiple filenames, returning those that matched.
+
+        When no real file system logic is required, we can compare against
+        the compiled expressions directly and skip the per-file match object.
+        """
+
+        if not self._real and len(self._include) == 1 and not self._exclude:
+            match = self._include[0].match
+            return [filename for filename in filenames if match(filename)]
+
+        return [filename for filename in filenames if self.match(filename, root_dir=root_dir)]
+
 
 def _pickle(p):
     return WcRegexp, (p._include, p._exclude, p._real, p._path, p._follow)
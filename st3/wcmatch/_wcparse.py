@@ -423,6 +423,7 @@ def _get_magic_symbols(ptype, unix, flags):
     return magic, magic_drive
 
 
+@functools.lru_cache(maxsize=1024)
 def is_magic(pattern, flags=0):
     """Check if pattern is magic."""
 
@@ -554,20 +555,7 @@ def get_case(flags):
 def escape_drive(drive, case):
     """Escape drive."""
 
-    if case and not util.PY36:
-        escaped = []
-        upper = drive.upper()
-        lower = drive.lower()
-
-        for index, u in enumerate(upper):
-            l = lower[index]
-            if u != l:
-                escaped.append('[{}{}]'.format(re.escape(l), re.escape(u)))
-            else:
-                escaped.append(re.escape(l))
-        return ''.join(escaped)
-    else:
-        return '(?i:{})'.format(re.escape(drive)) if case else re.escape(drive)
+    return '(?i:{})'.format(re.escape(drive)) if case else re.escape(drive)
 
 
 def is_unix_style(flags):
@@ -949,7 +937,7 @@ class WcParse(object):
             # Cannot do range with posix class
             # so escape last `-` if we think this
             # is the end of a range.
-            if end_range and i.index - 1 >= end_range:
+            if end_range and m.end(0) - 1 >= end_range:
                 result[-1] = '\\' + result[-1]
             result.append(posix.get_posix_property(m.group(1), self.is_bytes))
         return last_posix
@@ -1566,11 +1554,8 @@ class WcParse(object):
             result = prepend + result
 
         case_flag = 'i' if not self.case_sensitive else ''
-        if util.PY36:
-            pattern = r'^(?s{}:{})$'.format(case_flag, ''.join(result))
-        else:
-            pattern = r'(?s{})^(?:{})$'.format(case_flag, ''.join(result))
-			
+        pattern = r'^(?s{}:{})$'.format(case_flag, ''.join(result))
+
         if self.capture:
             # Strip out unnecessary regex comments
             pattern = pattern.replace('(?#)', '')
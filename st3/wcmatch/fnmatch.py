@@ -20,7 +20,9 @@ THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABI
 CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 IN THE SOFTWARE.
 """
+import functools
 from . import _wcparse
+from . import util
 
 __all__ = (
     "CASE", "EXTMATCH", "IGNORECASE", "RAWCHARS",
@@ -58,22 +60,37 @@ FLAG_MASK = (
     FORCEUNIX
 )
 
+_FORCE_MASK = FORCEWIN | FORCEUNIX
 
-def _flag_transform(flags):
+
+def _flag_transform(flags, _force_mask=_FORCE_MASK, _flag_mask=FLAG_MASK):
     """Transform flags to glob defaults."""
 
-    # Enabling both cancels out
-    if flags & FORCEUNIX and flags & FORCEWIN:
-        flags ^= FORCEWIN | FORCEUNIX
+    # Enabling both `FORCEWIN` and `FORCEUNIX` cancels them out
+    return (flags ^ (_force_mask if (flags & _force_mask) == _force_mask else 0)) & _flag_mask
+
+
+@functools.lru_cache(maxsize=500)
+def _compiled(patterns, flags, limit):
+    """Compile patterns, caching the result so repeat calls skip parsing."""
+
+    return _wcparse.compile(patterns, flags, limit)
+
 
-    return (flags & FLAG_MASK)
+@functools.lru_cache(maxsize=500)
+def _translated(patterns, flags, limit):
+    """Translate patterns, caching the result so repeat calls skip parsing."""
+
+    return _wcparse.translate(patterns, flags, limit)
 
 
 def translate(patterns, *, flags=0, limit=_wcparse.PATTERN_LIMIT):
     """Translate `fnmatch` pattern."""
 
     flags = _flag_transform(flags)
-    return _wcparse.translate(patterns, flags, limit)
+    positive, negative = _translated(util.to_tuple(patterns), flags, limit)
+    # Copy so mutating a result cannot poison the cache
+    return positive[:], negative[:]
 
 
 def fnmatch(filename, patterns, *, flags=0, limit=_wcparse.PATTERN_LIMIT):
@@ -85,21 +102,14 @@ def fnmatch(filename, patterns, *, flags=0, limit=_wcparse.PATTERN_LIMIT):
     """
 
     flags = _flag_transform(flags)
-    return _wcparse.compile(patterns, flags, limit).match(filename)
+    return _compiled(util.to_tuple(patterns), flags, limit).match(filename)
 
 
 def filter(filenames, patterns, *, flags=0, limit=_wcparse.PATTERN_LIMIT):  # noqa A001
     """Filter names using pattern."""
 
-    matches = []
-
     flags = _flag_transform(flags)
-    obj = _wcparse.compile(patterns, flags, limit)
-
-    for filename in filenames:
-        if obj.match(filename):
-            matches.append(filename)
-    return matches
+    return _compiled(util.to_tuple(patterns), flags, limit).match_many(filenames)
 
 
 def escape(pattern):
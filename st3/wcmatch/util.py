@@ -1,62 +1,53 @@
 """Compatibility module."""
 from __future__ import unicode_literals
 import sys
-import ctypes
 import os
-import stat
 import re
+import stat
 import unicodedata
 from functools import wraps
 import warnings
 
-PY37 = (3, 7) <= sys.version_info
-PY36 = (3, 6) <= sys.version_info
-PY35 = (3, 5) <= sys.version_info
-
 UNICODE = 0
 BYTES = 1
 
 CASE_FS = os.path.normcase('A') != os.path.normcase('a')
 
-RE_NORM = re.compile(
-    r'''(?x)
-    (/|\\/)|
-    (\\[abfnrtv\\])|
-    (\\(?:U[\da-fA-F]{8}|u[\da-fA-F]{4}|x[\da-fA-F]{2}|([0-7]{1,3})))|
-    (\\N\{[^}]*?\})|
-    (\\[^NUux]) |
-    (\\[NUux])
-    '''
+BACK_SLASH_TRANSLATION = (
+    {
+        r"\a": '\a',
+        r"\b": '\b',
+        r"\f": '\f',
+        r"\r": '\r',
+        r"\t": '\t',
+        r"\n": '\n',
+        r"\v": '\v',
+        r"\\": r'\\'
+    },
+    {
+        br"\a": b'\a',
+        br"\b": b'\b',
+        br"\f": b'\f',
+        br"\r": b'\r',
+        br"\t": b'\t',
+        br"\n": b'\n',
+        br"\v": b'\v',
+        br"\\": br'\\'
+    }
 )
 
-RE_BNORM = re.compile(
-    br'''(?x)
-    (/|\\/)|
-    (\\[abfnrtv\\])|
-    (\\(?:x[\da-fA-F]{2}|([0-7]{1,3})))|
-    (\\[^x]) |
-    (\\[x])
-    '''
-)
+_STD_ESCAPES = frozenset('abfnrtv\\')
+_OCTAL = frozenset('01234567')
+_HEX = frozenset('0123456789abcdefABCDEF')
+
+# Identity table used in place of `BACK_SLASH_TRANSLATION` when raw characters are disabled.
+_STD_IDENTITY = {k: k for k in BACK_SLASH_TRANSLATION[UNICODE]}
 
-BACK_SLASH_TRANSLATION = {
-    r"\a": '\a',
-    r"\b": '\b',
-    r"\f": '\f',
-    r"\r": '\r',
-    r"\t": '\t',
-    r"\n": '\n',
-    r"\v": '\v',
-    r"\\": r'\\',
-    br"\a": b'\a',
-    br"\b": b'\b',
-    br"\f": b'\f',
-    br"\r": b'\r',
-    br"\t": b'\t',
-    br"\n": b'\n',
-    br"\v": b'\v',
-    br"\\": br'\\'
-}
+# Double up any escape that doesn't pass through untouched in `ignore_escape` mode.
+RE_IGNORE_ESCAPE = (
+    re.compile(r'(\\[abfnrtv\\/])|(\\)(?=.)', re.DOTALL),
+    re.compile(br'(\\[abfnrtv\\/])|(\\)(?=.)', re.DOTALL)
+)
 
 if sys.platform.startswith('win'):
     _PLATFORM = "windows"
@@ -99,37 +90,112 @@ def norm_pattern(pattern, normalize, is_raw_chars, ignore_escape=False):
     if not normalize and not is_raw_chars and not ignore_escape:
         return pattern
 
-    def norm(m):
-        """Normalize the pattern."""
-
-        if m.group(1):
-            char = m.group(1)
-            if normalize:
-                char = br'\\\\' if is_bytes else r'\\\\' if len(char) > 1 else char
-        elif m.group(2):
-            char = BACK_SLASH_TRANSLATION[m.group(2)] if is_raw_chars else m.group(2)
-        elif is_raw_chars and m.group(4):
-            char = bytes([int(m.group(4), 8) & 0xFF]) if is_bytes else chr(int(m.group(4), 8))
-        elif is_raw_chars and m.group(3):
-            char = bytes([int(m.group(3)[2:], 16)]) if is_bytes else chr(int(m.group(3)[2:], 16))
-        elif is_raw_chars and not is_bytes and m.group(5):
-            char = unicodedata.lookup(m.group(5)[3:-1])
-        elif not is_raw_chars or m.group(5 if is_bytes else 6):
-            char = m.group(0)
-            if ignore_escape:
-                char = (b'\\' if is_bytes else '\\') + char
+    if not normalize and not is_raw_chars:
+        # `ignore_escape` alone just doubles up escapes, which a single C level
+        # substitution handles. Unicode named escapes are the one exception as
+        # their braced content must pass through untouched, so punt on those.
+        if is_bytes:
+            return RE_IGNORE_ESCAPE[BYTES].sub(br'\g<1>\g<2>\g<2>', pattern)
+        elif '\\N' not in pattern:
+            return RE_IGNORE_ESCAPE[UNICODE].sub(r'\g<1>\g<2>\g<2>', pattern)
+
+    string = pattern.decode('latin-1') if is_bytes else pattern
+    length = len(string)
+    # Bytes patterns historically normalize a bare `/` as well.
+    scan_slash = is_bytes and normalize
+
+    if '\\' not in string and (not scan_slash or '/' not in string):
+        # Nothing to normalize
+        return pattern
+
+    # Resolve flag dependent values once so the scan loop doesn't re-test
+    # the same constants for every escape.
+    esc_slash = r'\\\\' if normalize else '\\/'
+    std_table = BACK_SLASH_TRANSLATION[UNICODE] if is_raw_chars else _STD_IDENTITY
+    prefix = '\\' if ignore_escape else ''
+    octal_mask = 0xFF if is_bytes else 0x1FF
+
+    result = []
+    pos = 0
+    while pos < length:
+        i = string.find('\\', pos)
+        if scan_slash:
+            slash = string.find('/', pos)
+            if slash != -1 and (i == -1 or slash < i):
+                i = slash
+        if i == -1:
+            result.append(string[pos:])
+            break
+        result.append(string[pos:i])
+        if string[i] == '/':
+            result.append(r'\\\\')
+            pos = i + 1
+            continue
+        c = string[i + 1] if i + 1 < length else ''
+        if not c:
+            # Trailing backslash escapes nothing
+            result.append('\\')
+            pos = i + 1
+        elif c == '/':
+            result.append(esc_slash)
+            pos = i + 2
+        elif c in _STD_ESCAPES:
+            result.append(std_table[string[i:i + 2]])
+            pos = i + 2
+        elif c in _OCTAL:
+            end = i + 2
+            stop = min(i + 4, length)
+            while end < stop and string[end] in _OCTAL:
+                end += 1
+            if is_raw_chars:
+                result.append(chr(int(string[i + 1:end], 8) & octal_mask))
+            else:
+                result.append(prefix + string[i:end])
+            pos = end
+        elif c == 'x' or (not is_bytes and c in ('u', 'U')):
+            count = 2 if c == 'x' else 4 if c == 'u' else 8
+            digits = string[i + 2:i + 2 + count]
+            if len(digits) == count and all(d in _HEX for d in digits):
+                if is_raw_chars:
+                    result.append(chr(int(digits, 16)))
+                else:
+                    result.append(prefix + string[i:i + 2 + count])
+                pos = i + 2 + count
+            elif is_raw_chars:
+                raise SyntaxError(
+                    "Could not convert character value {} at position {:d}".format(pattern[i:i + 2], i)
+                )
+            else:
+                result.append(prefix + '\\' + c)
+                pos = i + 2
+        elif not is_bytes and c == 'N':
+            end = string.find('}', i + 3) if string[i + 2:i + 3] == '{' else -1
+            if end != -1:
+                if is_raw_chars:
+                    result.append(unicodedata.lookup(string[i + 3:end]))
+                else:
+                    result.append(prefix + string[i:end + 1])
+                pos = end + 1
+            elif is_raw_chars:
+                raise SyntaxError(
+                    "Could not convert character value {} at position {:d}".format(pattern[i:i + 2], i)
+                )
+            else:
+                result.append(prefix + '\\N')
+                pos = i + 2
         else:
-            value = m.group(6) if is_bytes else m.group(7)
-            pos = m.start(6) if is_bytes else m.start(7)
-            raise SyntaxError("Could not convert character value {} at position {:d}".format(value, pos))
-        return char
+            result.append(prefix + string[i:i + 2])
+            pos = i + 2
 
-    return (RE_BNORM if is_bytes else RE_NORM).sub(norm, pattern)
+    string = ''.join(result)
+    return string.encode('latin-1') if is_bytes else string
 
 
 class StringIter(object):
     """Preprocess replace tokens."""
 
+    __slots__ = ("_string", "_index")
+
     def __init__(self, string):
         """Initialize."""
 
@@ -142,9 +208,18 @@ class StringIter(object):
         return self
 
     def __next__(self):
-        """Python 3 iterator compatible next."""
+        """Iterate through characters of the string."""
 
-        return self.iternext()
+        index = self._index
+        try:
+            char = self._string[index]
+        except IndexError:  # pragma: no cover
+            raise StopIteration
+
+        self._index = index + 1
+        return char
+
+    iternext = __next__
 
     def match(self, pattern):
         """Perform regex match at index."""
@@ -178,17 +253,6 @@ class StringIter(object):
 
         self._index -= count
 
-    def iternext(self):
-        """Iterate through characters of the string."""
-
-        try:
-            char = self._string[self._index]
-            self._index += 1
-        except IndexError:  # pragma: no cover
-            raise StopIteration
-
-        return char
-
 
 class Immutable(object):
     """Immutable."""
@@ -198,8 +262,9 @@ class Immutable(object):
     def __init__(self, **kwargs):
         """Initialize."""
 
+        setter = super(Immutable, self).__setattr__
         for k, v in kwargs.items():
-            super(Immutable, self).__setattr__(k, v)
+            setter(k, v)
 
     def __setattr__(self, name, value):  # pragma: no cover
         """Prevent mutability."""
@@ -207,31 +272,34 @@ class Immutable(object):
         raise AttributeError('Class is immutable!')
 
 
+# Resolve the platform specific hidden check once at import so `is_hidden`
+# doesn't have to re-evaluate platform and `os.stat_result` capabilities per call.
+if _PLATFORM == "windows":  # pragma: no cover
+    def _is_sys_hidden(path):
+        """Check if file is hidden via `FILE_ATTRIBUTE_HIDDEN`."""
+
+        FILE_ATTRIBUTE_HIDDEN = 0x2
+        return bool(os.lstat(path).st_file_attributes & FILE_ATTRIBUTE_HIDDEN)
+
+elif _PLATFORM == "osx" and hasattr(os.stat_result, 'st_flags'):  # pragma: no cover
+    def _is_sys_hidden(path):
+        """Check if file is hidden via `UF_HIDDEN`."""
+
+        return bool(os.lstat(path).st_flags & stat.UF_HIDDEN)
+
+else:
+    def _is_sys_hidden(path):
+        """Check if file is hidden (no system attribute support, dot files only)."""
+
+        return False
+
+
 def is_hidden(path):
     """Check if file is hidden."""
 
-    hidden = False
     f = os.path.basename(path)
-    if f[:1] in ('.', b'.'):
-        # Count dot file as hidden on all systems
-        hidden = True
-    elif _PLATFORM == 'windows':
-        # On Windows, look for `FILE_ATTRIBUTE_HIDDEN`
-        FILE_ATTRIBUTE_HIDDEN = 0x2
-        if PY35:
-            results = os.lstat(path)
-            hidden = bool(results.st_file_attributes & FILE_ATTRIBUTE_HIDDEN)
-        else:
-            if isinstance(path, bytes):
-                attrs = ctypes.windll.kernel32.GetFileAttributesA(path)
-            else:
-                attrs = ctypes.windll.kernel32.GetFileAttributesW(path)
-            hidden = attrs != -1 and attrs & FILE_ATTRIBUTE_HIDDEN
-    elif _PLATFORM == "osx":  # pragma: no cover
-        # On macOS, look for `UF_HIDDEN`
-        results = os.lstat(path)
-        hidden = bool(results.st_flags & stat.UF_HIDDEN)
-    return hidden
+    # Count dot file as hidden on all systems
+    return f[:1] in ('.', b'.') or _is_sys_hidden(path)
 
 
 def deprecated(message, stacklevel=2):  # pragma: no cover
@@ -265,11 +333,7 @@ def warn_deprecated(message, stacklevel=2):  # pragma: no cover
 
 
 def fscodec(path, encode=False):
-    """
-    Provide common interface when using to translate path-like files.
-
-    Python 3.5 does not support `os.PathLike` interfaces, so we only return strings and bytes.
-    """
+    """Translate path-like files to strings and bytes."""
 
     if not isinstance(path, (str, bytes)):
         path = os.fsencode(path) if encode else os.fsdecode(path)